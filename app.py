@@ -7,23 +7,171 @@ Microsoft's neural text-to-speech via edge-tts.
 """
 
 import asyncio
+import atexit
 import io
+import json
 import os
-import re
+import queue
 import random
+import re
+import threading
 import uuid
 from typing import Dict, List, Tuple, Optional
+from urllib.parse import urlparse
 
-from flask import Flask, render_template, request, jsonify, Response, session
+from flask import (Flask, render_template, request, jsonify, Response,
+                   session, stream_with_context)
+from flask.json.provider import JSONProvider
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+import soupsieve
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+import cachetools
 import edge_tts
+import httpx
+import orjson
+import redis
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
+app.json = ORJSONProvider(app)
+
+# Shared HTTP client with a connection pool, reused across requests
+http_client = httpx.Client(
+    http2=True,
+    follow_redirects=True,
+    timeout=10.0,
+    headers={'User-Agent': 'Mozilla/5.0 (compatible; MoltReader/1.0)'}
+)
+
+class SessionStore:
+    """
+    Server-side session storage.
+
+    Backed by Redis when REDIS_URL is set, so sessions are shared across
+    Gunicorn workers and expire automatically. Falls back to an
+    in-process TTL+LRU cache for single-worker deployments with no
+    Redis, so abandoned sessions (and their audio) can't grow the
+    resident set without bound.
+    """
+
+    TTL = 3600  # seconds
+
+    def __init__(self):
+        self._redis = None
+        redis_url = os.environ.get('REDIS_URL')
+        if redis_url:
+            self._redis = redis.Redis.from_url(redis_url)
+        # cachetools caches aren't thread-safe, hence the lock
+        self._local: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=1000, ttl=self.TTL)
+        self._local_lock = threading.RLock()
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f'molt:{session_id}'
+
+    @staticmethod
+    def _audio_key(session_id: str, index: int) -> str:
+        return f'molt:{session_id}:audio:{index}'
+
+    def get(self, session_id: str) -> Optional[dict]:
+        """Get session data, or None if the session doesn't exist."""
+        if self._redis is not None:
+            raw = self._redis.get(self._key(session_id))
+            return json.loads(raw) if raw else None
+        with self._local_lock:
+            return self._local.get(session_id)
+
+    def save(self, session_id: str, data: dict):
+        """Save session data, refreshing its TTL."""
+        if self._redis is not None:
+            self._redis.set(self._key(session_id), json.dumps(data), ex=self.TTL)
+        else:
+            with self._local_lock:
+                self._local[session_id] = data
+
+    def delete(self, session_id: str):
+        """Delete a session and its cached audio."""
+        data = self.get(session_id)
+        if self._redis is not None:
+            keys = [self._key(session_id)]
+            if data:
+                item_count = len(data.get('content', []))
+                keys.extend(self._audio_key(session_id, i) for i in range(item_count))
+            self._redis.delete(*keys)
+        else:
+            with self._local_lock:
+                self._local.pop(session_id, None)
+
+    def get_audio(self, session_id: str, index: int) -> Optional[bytes]:
+        """Get cached audio bytes for one item, or None."""
+        if self._redis is not None:
+            return self._redis.get(self._audio_key(session_id, index))
+        with self._local_lock:
+            session_data = self._local.get(session_id)
+            if session_data is None:
+                return None
+            return session_data.get('audio', {}).get(index)
+
+    def set_audio(self, session_id: str, index: int, audio: bytes):
+        """Cache audio bytes for one item."""
+        if self._redis is not None:
+            self._redis.set(self._audio_key(session_id, index), audio, ex=self.TTL)
+        else:
+            with self._local_lock:
+                session_data = self._local.get(session_id)
+                if session_data is not None:
+                    session_data.setdefault('audio', {})[index] = audio
+
+    def clear_audio(self, session_id: str, item_count: int):
+        """
+        Drop all cached audio for a session.
+
+        Must be called whenever the session's content is replaced:
+        per-index audio written by set_audio would otherwise keep serving
+        the previous content's synthesis at any index the new prefetch
+        hasn't (or never) overwritten. item_count is the length of the
+        content the audio was generated for.
+        """
+        if self._redis is not None:
+            if item_count > 0:
+                self._redis.delete(*(self._audio_key(session_id, i)
+                                     for i in range(item_count)))
+        else:
+            with self._local_lock:
+                session_data = self._local.get(session_id)
+                if session_data is not None:
+                    session_data.pop('audio', None)
+
+
+session_store = SessionStore()
+
+# Long-lived event loop on a background thread, shared across requests.
+# Avoids the loop setup/teardown of asyncio.run per call and lets
+# edge-tts reuse connections between requests.
+_event_loop = asyncio.new_event_loop()
+threading.Thread(target=_event_loop.run_forever, daemon=True).start()
+atexit.register(lambda: _event_loop.call_soon_threadsafe(_event_loop.stop))
 
-# Server-side session storage (in production, use Redis or similar)
-sessions: Dict[str, dict] = {}
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop).result()
 
 
 class EdgeTTSVoiceManager:
@@ -62,62 +210,273 @@ class EdgeTTSVoiceManager:
     def __init__(self):
         self.agent_voices: Dict[str, Tuple[str, str]] = {}
         self.available_voices = [(v[0], v[1]) for v in self.ENGLISH_VOICES]
-        self.assigned_voices: List[str] = []
+        # Unassigned voices in pre-shuffled order, so assigning a new
+        # agent is an O(1) pop instead of an O(n*k) rebuild-and-choose
+        self.remaining_voices = random.sample(
+            self.available_voices, len(self.available_voices))
 
     def get_voice_for_agent(self, agent_name: str) -> Tuple[str, str]:
         """Get or assign a voice for a given agent."""
         if agent_name in self.agent_voices:
             return self.agent_voices[agent_name]
 
-        unassigned = [v for v in self.available_voices if v[0] not in self.assigned_voices]
-
-        if unassigned:
-            voice = random.choice(unassigned)
+        if self.remaining_voices:
+            voice = self.remaining_voices.pop()
         else:
             voice = random.choice(self.available_voices)
 
         self.agent_voices[agent_name] = voice
-        self.assigned_voices.append(voice[0])
-
         return voice
 
     def reset(self):
         """Reset all voice assignments."""
         self.agent_voices.clear()
-        self.assigned_voices.clear()
+        self.remaining_voices = random.sample(
+            self.available_voices, len(self.available_voices))
 
     def to_dict(self) -> dict:
         """Serialize for session storage."""
         return {
             'agent_voices': self.agent_voices,
-            'assigned_voices': self.assigned_voices
+            'remaining_voices': self.remaining_voices
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'EdgeTTSVoiceManager':
-        """Deserialize from session storage."""
+        """Deserialize from session storage (tuples may arrive as lists)."""
         manager = cls()
-        manager.agent_voices = data.get('agent_voices', {})
-        manager.assigned_voices = data.get('assigned_voices', [])
+        manager.agent_voices = {
+            agent: tuple(voice)
+            for agent, voice in data.get('agent_voices', {}).items()
+        }
+        if 'remaining_voices' in data:
+            manager.remaining_voices = [tuple(v) for v in data['remaining_voices']]
         return manager
 
 
+class BrowserPool:
+    """
+    Lazily-initialized, shared Playwright browser.
+
+    Launching Chromium takes 1-2 seconds; keeping one browser alive and
+    handing out pages from a persistent context amortizes that cost
+    across all fetches. The persistent profile directory lets Chromium
+    keep its HTTP and compiled-JS caches between requests, so repeated
+    Moltbook assets are served from disk.
+
+    Uses the async Playwright API on the shared event loop: the sync API
+    is thread-affine, which doesn't mix with threaded WSGI workers,
+    whereas coroutines submitted from any request thread all run on the
+    one loop that owns the browser.
+    """
+
+    PROFILE_DIR = os.path.expanduser('~/.cache/moltreader/pw-profile')
+
+    _lock = asyncio.Lock()
+    _playwright = None
+    _context = None
+
+    @classmethod
+    async def get_context(cls):
+        """Get the shared persistent context, launching it on first use."""
+        async with cls._lock:
+            if cls._context is None:
+                os.makedirs(cls.PROFILE_DIR, exist_ok=True)
+                cls._playwright = await async_playwright().start()
+                cls._context = await cls._playwright.chromium.launch_persistent_context(
+                    cls.PROFILE_DIR,
+                    headless=True,
+                    args=['--disable-dev-shm-usage', '--no-sandbox']
+                )
+        return cls._context
+
+    @classmethod
+    async def _shutdown_async(cls):
+        async with cls._lock:
+            if cls._context is not None:
+                await cls._context.close()
+                cls._context = None
+            if cls._playwright is not None:
+                await cls._playwright.stop()
+                cls._playwright = None
+
+    @classmethod
+    def shutdown(cls):
+        """Close the browser context and stop Playwright."""
+        try:
+            asyncio.run_coroutine_threadsafe(
+                cls._shutdown_async(), _event_loop).result(timeout=10)
+        except Exception:
+            pass
+
+
+atexit.register(BrowserPool.shutdown)
+
+
+# Resource types the scraper never needs; aborting them cuts most of the
+# bytes a Moltbook page would otherwise transfer
+BLOCKED_RESOURCE_TYPES = {'image', 'stylesheet', 'font', 'media', 'other'}
+
+# Analytics/tracker hosts whose requests would otherwise count toward
+# page readiness for no content benefit
+BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'segment.io',
+    'sentry.io',
+)
+
+# Injected before any page script runs: zero out CSS animations and
+# transitions so elements are laid out immediately instead of fading in
+_DISABLE_ANIMATIONS_JS = """
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = '*, *::before, *::after {'
+        + 'animation-duration: 0s !important;'
+        + 'animation-delay: 0s !important;'
+        + 'transition-duration: 0s !important;'
+        + 'transition-delay: 0s !important;'
+        + '}';
+    document.head.appendChild(style);
+});
+"""
+
+# In-browser extraction mirroring _extract_content: returns
+# [{author, text}, ...] or null, so only the extracted strings cross the
+# CDP boundary instead of the full rendered HTML
+_EXTRACT_JS = """
+() => {
+    const title = document.querySelector('h1.text-xl');
+    if (!title) return null;
+
+    const proseText = (prose) => {
+        if (!prose) return '';
+        const parts = [];
+        prose.querySelectorAll('p, li, pre').forEach(el => {
+            const parent = el.parentElement;
+            if (parent && (parent.tagName === 'P' || parent.tagName === 'LI')) return;
+            const text = el.textContent.trim();
+            if (text) parts.push(text);
+        });
+        if (!parts.length) {
+            const text = prose.textContent.trim();
+            if (text) parts.push(text);
+        }
+        return parts.join(' ');
+    };
+
+    const container = title.closest('div[class*="flex-1"]')
+        || title.closest('div[class*="rounded-lg"]');
+    if (!container) return null;
+
+    const link = container.querySelector('a[href^="/u/"]')
+        || (container.parentElement
+            && container.parentElement.querySelector('a[href^="/u/"]'))
+        || (title.parentElement
+            && title.parentElement.querySelector('a[href^="/u/"]'))
+        || document.querySelector('a[href^="/u/"]');
+
+    const items = [];
+    const author = link ? link.textContent.trim() : 'Author';
+    const titleText = title.textContent.trim();
+    const body = proseText(container.querySelector('div.prose'));
+    items.push({author, text: body ? `${titleText}. ${body}` : titleText});
+
+    const header = Array.from(document.querySelectorAll('h2'))
+        .find(h => h.textContent.includes('Comments'));
+    if (header) {
+        let commentsDiv = header.nextElementSibling;
+        while (commentsDiv && commentsDiv.tagName !== 'DIV') {
+            commentsDiv = commentsDiv.nextElementSibling;
+        }
+        if (!commentsDiv && header.parentElement) {
+            commentsDiv = header.parentElement.querySelector('div.rounded-lg');
+        }
+        if (commentsDiv) {
+            commentsDiv.querySelectorAll('div.py-2').forEach(div => {
+                const commentLink = div.querySelector('a[href^="/u/"]');
+                const commentAuthor = commentLink
+                    ? commentLink.textContent.trim() : 'Commenter';
+                const text = proseText(div.querySelector('div.prose'));
+                if (text) items.push({author: commentAuthor, text});
+            });
+        }
+    }
+
+    return items;
+}
+"""
+
+# Compiled once; author links are looked up several times per page
+_AUTHOR_LINK = soupsieve.compile('a[href^="/u/"]')
+
+# Byte-range request header, e.g. "bytes=0-" or "bytes=1024-2047"
+_RANGE_RE = re.compile(r'bytes=(\d+)-(\d*)')
+
+# Profile-link href, for find_next fallbacks
+_USER_HREF_RE = re.compile(r'^/u/')
+
+# Parsed pages keyed by URL, so reloads within the TTL skip the whole
+# fetch+parse pipeline. cachetools isn't thread-safe, hence the lock.
+_page_cache: cachetools.TTLCache = cachetools.TTLCache(maxsize=256, ttl=300)
+_page_cache_lock = threading.Lock()
+
+# Synthesized audio keyed by (voice_id, text). The same text read by the
+# same voice recurs across sessions (reloads, repeated reactions); a hit
+# skips the whole edge-tts round trip.
+_audio_cache: cachetools.LRUCache = cachetools.LRUCache(maxsize=256)
+_audio_cache_lock = threading.Lock()
+
+
 class MoltbookScraper:
     """Scrapes Moltbook pages to extract posts and comments."""
 
-    def fetch_page(self, url: str) -> Tuple[List[Tuple[str, str]], Optional[str]]:
-        """Fetch and parse a Moltbook page."""
+    def fetch_page(self, url: str,
+                   force: bool = False) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        Fetch and parse a Moltbook page.
+
+        Pass force=True to bypass the page cache and re-fetch, e.g. when
+        the user wants to pick up new comments within the cache TTL.
+        """
         try:
-            if 'moltbook.com' not in url:
+            # Validate the origin properly: a substring check would both
+            # accept URLs like https://evil.com/?x=moltbook.com and pay
+            # a browser launch before rejecting them
+            parsed = urlparse(url)
+            host = parsed.hostname or ''
+            if parsed.scheme not in ('http', 'https') or not (
+                    host == 'moltbook.com' or host.endswith('.moltbook.com')):
                 return [], "URL must be from moltbook.com"
 
-            html_content = self._fetch_with_playwright(url)
-            soup = BeautifulSoup(html_content, 'html.parser')
-            content_items = self._extract_content(soup)
+            if not force:
+                with _page_cache_lock:
+                    cached = _page_cache.get(url)
+                if cached is not None:
+                    return cached, None
+
+            content_items = None
+            html_content = self._fetch_with_http(url)
+            if html_content is not None:
+                content_items = self._extract(html_content)
+
+            # A client-rendered shell can pass the cheap marker check in
+            # _fetch_with_http yet extract to nothing; only trust the
+            # HTTP path when it actually yields items, otherwise render
+            # the page with Playwright before reporting failure
+            if not content_items:
+                content_items, html_content = run_async(
+                    self._fetch_with_playwright(url))
+                if content_items is None:
+                    content_items = self._extract(html_content)
 
             if not content_items:
                 return [], "No posts or comments found on this page"
 
+            with _page_cache_lock:
+                _page_cache[url] = content_items
+
             return content_items, None
 
         except PlaywrightTimeout:
@@ -125,22 +484,102 @@ class MoltbookScraper:
         except Exception as e:
             return [], f"Error fetching page: {str(e)}"
 
-    def _fetch_with_playwright(self, url: str) -> str:
-        """Fetch a page using Playwright headless browser."""
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='networkidle', timeout=30000)
-            page.wait_for_selector('h1.text-xl', timeout=15000)
+    def _extract(self, html_content: str) -> List[Tuple[str, str]]:
+        """Extract content from HTML with the best available parser."""
+        if HTMLParser is not None:
+            return self._extract_content_fast(html_content)
 
-            try:
-                page.wait_for_selector('h2:has-text("Comments")', timeout=10000)
-            except PlaywrightTimeout:
-                pass
+        soup = BeautifulSoup(html_content, 'lxml')
+        return self._extract_content(soup)
+
+    def _fetch_with_http(self, url: str) -> Optional[str]:
+        """
+        Fetch a page with a plain HTTP GET, skipping the headless browser.
+
+        Much cheaper than Playwright when the server returns pre-rendered
+        HTML. Returns None if the response doesn't contain the expected
+        post markup, in which case the caller falls back to Playwright.
+        """
+        try:
+            response = http_client.get(url)
+        except httpx.HTTPError:
+            return None
+
+        if response.status_code != 200:
+            return None
+
+        html_content = response.text
+        if 'text-xl' not in html_content:
+            return None
+
+        return html_content
+
+    async def _fetch_with_playwright(
+            self, url: str) -> Tuple[Optional[List[Tuple[str, str]]], str]:
+        """
+        Fetch a page using the shared Playwright browser.
+
+        Extraction runs inside the browser via page.evaluate, so only the
+        author/text strings cross the CDP boundary instead of hundreds of
+        KB of rendered HTML. Returns (content_items, html): on successful
+        in-browser extraction html is empty; if the script returns null,
+        content_items is None and html holds the full page for the
+        Python-side parsers.
+        """
+        context = await BrowserPool.get_context()
+        page = await context.new_page()
+        try:
+            # Only the DOM text matters for TTS; skip downloading images,
+            # styles, fonts and media entirely
+            async def filter_resources(route):
+                request = route.request
+                if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                        or any(host in request.url for host in BLOCKED_HOSTS)):
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await page.route('**/*', filter_resources)
+            await page.add_init_script(_DISABLE_ANIMATIONS_JS)
+
+            # domcontentloaded returns as soon as the DOM is built;
+            # networkidle could stall for seconds on pages that keep
+            # analytics sockets open
+            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+
+            # Single readiness check: the post title must be present, and
+            # we give the Comments section a short budget to appear before
+            # proceeding without it
+            await page.wait_for_function(
+                "() => document.querySelector('h1.text-xl') && "
+                "(Array.from(document.querySelectorAll('h2'))"
+                ".some(h => h.textContent.includes('Comments')) "
+                "|| performance.now() > 3000)",
+                timeout=8000
+            )
+
+            raw_items = await page.evaluate(_EXTRACT_JS)
+            if raw_items:
+                return self._clean_raw_items(raw_items), ''
+
+            return None, await page.content()
+        finally:
+            await page.close()
+
+    @staticmethod
+    def _clean_raw_items(raw_items: List[dict]) -> List[Tuple[str, str]]:
+        """Normalize items returned by the in-browser extraction script."""
+        items = []
+        for raw in raw_items:
+            author = ' '.join((raw.get('author') or '').split()) or 'Author'
+            if author.startswith('u/'):
+                author = author[2:]
+
+            text = ' '.join((raw.get('text') or '').split())
+            if text:
+                items.append((author, text))
 
-            html_content = page.content()
-            browser.close()
-            return html_content
+        return items
 
     def _extract_content(self, soup: BeautifulSoup) -> List[Tuple[str, str]]:
         """Extract post and comment content."""
@@ -163,34 +602,40 @@ class MoltbookScraper:
 
         title = title_elem.get_text(strip=True)
 
-        post_container = title_elem.find_parent('div', class_=lambda c: c and 'flex-1' in c)
+        # Walk up from the title once, remembering both candidate
+        # containers, instead of two separate find_parent traversals
+        post_container = None
+        rounded_container = None
+        for parent in title_elem.parents:
+            if parent.name != 'div':
+                continue
+            classes = parent.get('class') or []
+            if post_container is None and any('flex-1' in c for c in classes):
+                post_container = parent
+                break
+            if rounded_container is None and any('rounded-lg' in c for c in classes):
+                rounded_container = parent
+
         if not post_container:
-            post_container = title_elem.find_parent('div', class_=lambda c: c and 'rounded-lg' in c)
+            post_container = rounded_container
 
         if not post_container:
             return None
 
         author = "Author"
-        author_link = post_container.select_one('a[href^="/u/"]')
+        author_link = _AUTHOR_LINK.select_one(post_container)
 
-        if not author_link:
-            parent = post_container.parent
-            if parent:
-                author_link = parent.select_one('a[href^="/u/"]')
+        if not author_link and post_container.parent:
+            author_link = _AUTHOR_LINK.select_one(post_container.parent)
 
-        if not author_link:
-            parent_of_title = title_elem.parent
-            if parent_of_title:
-                author_link = parent_of_title.select_one('a[href^="/u/"]')
+        if not author_link and title_elem.parent:
+            author_link = _AUTHOR_LINK.select_one(title_elem.parent)
 
         if not author_link:
-            comments_header = soup.find('h2', string=lambda s: s and 'Comments' in s)
-            all_user_links = soup.select('a[href^="/u/"]')
-            for link in all_user_links:
-                if comments_header and link.find_parent() == comments_header.find_parent():
-                    break
-                author_link = link
-                break
+            # First user link after the title in document order; a single
+            # forward walk that stops at the first hit, rather than
+            # scanning the whole page from the root
+            author_link = title_elem.find_next('a', href=_USER_HREF_RE)
 
         if author_link:
             author = author_link.get_text(strip=True)
@@ -226,11 +671,14 @@ class MoltbookScraper:
         if not comments_container:
             return comments
 
-        comment_divs = comments_container.select('div.py-2')
+        # :has() filters out py-2 utility divs that aren't comments in
+        # the same C-side walk, instead of testing each div in Python
+        comment_divs = comments_container.select('div.py-2:has(div.prose)')
+        extract_prose = self._extract_prose_text
 
         for comment_div in comment_divs:
             author = "Commenter"
-            author_link = comment_div.select_one('a[href^="/u/"]')
+            author_link = _AUTHOR_LINK.select_one(comment_div)
             if author_link:
                 author = author_link.get_text(strip=True)
                 if author.startswith('u/'):
@@ -238,7 +686,7 @@ class MoltbookScraper:
 
             prose_div = comment_div.select_one('div.prose')
             if prose_div:
-                content = self._extract_prose_text(prose_div)
+                content = extract_prose(prose_div)
                 if content:
                     comments.append((author, content))
 
@@ -249,38 +697,138 @@ class MoltbookScraper:
         if not prose_element:
             return ""
 
-        text_parts = []
+        # One C-side subtree walk; nested inline tags come along for
+        # free, and str.split collapses the leftover whitespace
+        return ' '.join(prose_element.get_text(separator=' ').split())
 
-        for elem in prose_element.find_all(['p', 'li', 'pre', 'code', 'em', 'strong'], recursive=True):
-            if elem.parent.name in ['p', 'li']:
-                continue
+    def _extract_content_fast(self, html_content: str) -> List[Tuple[str, str]]:
+        """Extract post and comment content using selectolax (C parser)."""
+        tree = HTMLParser(html_content)
+        content_items = []
 
-            text = elem.get_text(separator=' ', strip=True)
-            if text:
-                text_parts.append(text)
+        main_post = self._find_main_post_fast(tree)
+        if main_post:
+            content_items.append(main_post)
 
-        if not text_parts:
-            text = prose_element.get_text(separator=' ', strip=True)
-            text_parts = [text] if text else []
+        comments = self._find_comments_fast(tree)
+        content_items.extend(comments)
 
-        full_text = ' '.join(text_parts)
-        full_text = re.sub(r'\s+', ' ', full_text)
+        return content_items
 
-        return full_text.strip()
+    @staticmethod
+    def _node_has_class(node, token: str) -> bool:
+        """Check whether a selectolax node's class attribute contains token."""
+        class_attr = node.attributes.get('class') or ''
+        return token in class_attr
 
+    def _find_main_post_fast(self, tree) -> Optional[Tuple[str, str]]:
+        """selectolax version of _find_main_post."""
+        title_elem = tree.css_first('h1.text-xl')
+        if not title_elem:
+            return None
 
-def get_session_data(session_id: str) -> dict:
-    """Get or create session data."""
-    if session_id not in sessions:
-        sessions[session_id] = {
-            'content': [],
-            'voice_manager': EdgeTTSVoiceManager().to_dict()
-        }
-    return sessions[session_id]
+        title = title_elem.text(separator=' ', strip=True)
+
+        post_container = None
+        parent = title_elem.parent
+        while parent is not None and parent.tag != 'html':
+            if parent.tag == 'div' and self._node_has_class(parent, 'flex-1'):
+                post_container = parent
+                break
+            parent = parent.parent
+
+        if not post_container:
+            parent = title_elem.parent
+            while parent is not None and parent.tag != 'html':
+                if parent.tag == 'div' and self._node_has_class(parent, 'rounded-lg'):
+                    post_container = parent
+                    break
+                parent = parent.parent
+
+        if not post_container:
+            return None
+
+        author = "Author"
+        author_link = post_container.css_first('a[href^="/u/"]')
+
+        if not author_link and post_container.parent is not None:
+            author_link = post_container.parent.css_first('a[href^="/u/"]')
+
+        if not author_link and title_elem.parent is not None:
+            author_link = title_elem.parent.css_first('a[href^="/u/"]')
+
+        if not author_link:
+            author_link = tree.css_first('a[href^="/u/"]')
+
+        if author_link:
+            author = author_link.text(strip=True)
+            if author.startswith('u/'):
+                author = author[2:]
+
+        prose_div = post_container.css_first('div.prose')
+        if prose_div:
+            content = self._extract_prose_text_fast(prose_div)
+        else:
+            content = ""
+
+        full_text = f"{title}. {content}" if content else title
+        return (author, full_text)
+
+    def _find_comments_fast(self, tree) -> List[Tuple[str, str]]:
+        """selectolax version of _find_comments."""
+        comments = []
+
+        comments_header = None
+        for h2 in tree.css('h2'):
+            if 'Comments' in h2.text():
+                comments_header = h2
+                break
+
+        if not comments_header:
+            return comments
+
+        comments_container = comments_header.next
+        while comments_container is not None and comments_container.tag != 'div':
+            comments_container = comments_container.next
+
+        if not comments_container and comments_header.parent is not None:
+            comments_container = comments_header.parent.css_first('div.rounded-lg')
+
+        if not comments_container:
+            return comments
+
+        for comment_div in comments_container.css('div.py-2'):
+            author = "Commenter"
+            author_link = comment_div.css_first('a[href^="/u/"]')
+            if author_link:
+                author = author_link.text(strip=True)
+                if author.startswith('u/'):
+                    author = author[2:]
+
+            prose_div = comment_div.css_first('div.prose')
+            if prose_div:
+                content = self._extract_prose_text_fast(prose_div)
+                if content:
+                    comments.append((author, content))
+
+        return comments
+
+    def _extract_prose_text_fast(self, prose_node) -> str:
+        """selectolax version of _extract_prose_text."""
+        if not prose_node:
+            return ""
+
+        return ' '.join(prose_node.text(separator=' ').split())
 
 
 async def generate_audio(text: str, voice_id: str) -> bytes:
-    """Generate audio using edge-tts."""
+    """Generate audio using edge-tts, consulting the shared audio cache."""
+    key = (voice_id, text)
+    with _audio_cache_lock:
+        cached = _audio_cache.get(key)
+    if cached is not None:
+        return cached
+
     communicate = edge_tts.Communicate(text, voice_id)
     audio_data = io.BytesIO()
 
@@ -288,7 +836,93 @@ async def generate_audio(text: str, voice_id: str) -> bytes:
         if chunk["type"] == "audio":
             audio_data.write(chunk["data"])
 
-    return audio_data.getvalue()
+    audio = audio_data.getvalue()
+    with _audio_cache_lock:
+        _audio_cache[key] = audio
+    return audio
+
+
+def stream_audio(text: str, voice_id: str, on_complete=None):
+    """
+    Yield edge-tts audio chunks as they arrive from the service.
+
+    The synthesis coroutine runs on the shared event loop and feeds a
+    queue that this sync generator drains, so the first bytes reach the
+    client as soon as edge-tts produces them instead of after the whole
+    MP3 is buffered. If on_complete is given it is called with the full
+    audio bytes once the stream ends.
+    """
+    key = (voice_id, text)
+    with _audio_cache_lock:
+        cached = _audio_cache.get(key)
+    if cached is not None:
+        yield cached
+        if on_complete is not None:
+            on_complete(cached)
+        return
+
+    chunk_queue: queue.Queue = queue.Queue()
+
+    async def produce():
+        try:
+            communicate = edge_tts.Communicate(text, voice_id)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    chunk_queue.put(chunk["data"])
+        except Exception as exc:
+            # Distinct from the end-of-stream sentinel: a mid-synthesis
+            # failure must not let the partial chunks be treated (and
+            # cached) as a complete MP3
+            chunk_queue.put(exc)
+        else:
+            chunk_queue.put(None)
+
+    asyncio.run_coroutine_threadsafe(produce(), _event_loop)
+
+    received = []
+    while True:
+        data = chunk_queue.get()
+        if data is None:
+            break
+        if isinstance(data, Exception):
+            raise data
+        received.append(data)
+        yield data
+
+    if received:
+        audio = b''.join(received)
+        with _audio_cache_lock:
+            _audio_cache[key] = audio
+        if on_complete is not None:
+            on_complete(audio)
+
+
+async def prefetch_all_audio(content: List[Tuple[str, str]],
+                             voice_ids: List[str]) -> Dict[int, bytes]:
+    """
+    Generate audio for all content items concurrently.
+
+    edge-tts is network-bound, so overlapping the streams gives
+    near-linear speedup. Concurrency is bounded by a semaphore to stay
+    polite to the service; items that fail are simply skipped and will
+    be generated on demand instead.
+    """
+    semaphore = asyncio.Semaphore(8)
+
+    async def generate_one(author: str, text: str, voice_id: str) -> Optional[bytes]:
+        async with semaphore:
+            try:
+                return await generate_audio(f"{author} says, {text}", voice_id)
+            except Exception:
+                return None
+
+    tasks = [
+        generate_one(author, text, voice_id)
+        for (author, text), voice_id in zip(content, voice_ids)
+    ]
+    results = await asyncio.gather(*tasks)
+
+    return {i: audio for i, audio in enumerate(results) if audio is not None}
 
 
 @app.route('/')
@@ -299,11 +933,25 @@ def index():
     return render_template('index.html')
 
 
+def _ndjson_line(obj: dict) -> bytes:
+    """Serialize one object as an NDJSON line."""
+    return orjson.dumps(obj) + b'\n'
+
+
 @app.route('/api/load', methods=['POST'])
 def load_url():
-    """Load and parse a Moltbook URL."""
+    """
+    Load and parse a Moltbook URL.
+
+    Responds with an NDJSON stream: a line with the item count, then one
+    line per content item as it is assigned a voice, then a completion
+    line. Streaming lets the UI fill in progressively instead of staying
+    blank until the whole page is processed. Scrape errors arrive as a
+    line with an 'error' key.
+    """
     data = request.get_json()
     url = data.get('url', '').strip()
+    force = bool(data.get('force'))
 
     if not url:
         return jsonify({'error': 'No URL provided'}), 400
@@ -311,73 +959,140 @@ def load_url():
     session_id = session.get('session_id', str(uuid.uuid4()))
     session['session_id'] = session_id
 
-    scraper = MoltbookScraper()
-    content, error = scraper.fetch_page(url)
+    def generate():
+        scraper = MoltbookScraper()
+        content, error = scraper.fetch_page(url, force=force)
+
+        if error:
+            yield _ndjson_line({'error': error})
+            return
+
+        yield _ndjson_line({'item_count': len(content)})
+
+        # Reset voice manager for new content; assignments are per-index
+        # so /api/audio can look voices up directly instead of rebuilding
+        # the voice manager per request
+        voice_manager = EdgeTTSVoiceManager()
+        assignments = [
+            list(voice_manager.get_voice_for_agent(author))
+            for author, _ in content
+        ]
+
+        # Publish the full new state in one save before any item line is
+        # flushed: the generator blocks on slow NDJSON consumers, and
+        # mutating the live session dict piecemeal would let a concurrent
+        # /api/audio request pair the new content with the old
+        # assignments for the duration of the stream. The previous load's
+        # audio is stale for the new content (and its reshuffled voices),
+        # so it is dropped in the same step
+        previous = session_store.get(session_id)
+        previous_count = len(previous.get('content', [])) if previous else 0
+        session_store.clear_audio(session_id, previous_count)
+        session_store.save(session_id, {
+            'content': content,
+            'assignments': assignments,
+            'voice_manager': voice_manager.to_dict()
+        })
 
-    if error:
-        return jsonify({'error': error}), 400
+        # Pre-generate all audio concurrently in the background; items
+        # requested before their prefetch finishes stream on demand
+        def prefetch():
+            voice_ids = [voice_id for voice_id, _ in assignments]
+            audio_map = run_async(prefetch_all_audio(content, voice_ids))
+            for i, audio in audio_map.items():
+                session_store.set_audio(session_id, i, audio)
 
-    # Reset voice manager for new content
-    voice_manager = EdgeTTSVoiceManager()
+        threading.Thread(target=prefetch, daemon=True).start()
 
-    # Store in session
-    session_data = get_session_data(session_id)
-    session_data['content'] = content
-    session_data['voice_manager'] = voice_manager.to_dict()
+        for i, (author, text) in enumerate(content):
+            yield _ndjson_line({
+                'index': i,
+                'author': author,
+                'text': text,
+                'voice_name': assignments[i][1]
+            })
 
-    # Return content metadata
-    items = []
-    for i, (author, text) in enumerate(content):
-        voice_id, voice_name = voice_manager.get_voice_for_agent(author)
-        items.append({
-            'index': i,
-            'author': author,
-            'text': text,
-            'voice_name': voice_name
-        })
+        yield _ndjson_line({'success': True, 'item_count': len(content)})
 
-    # Update voice manager after assignments
-    session_data['voice_manager'] = voice_manager.to_dict()
-
-    return jsonify({
-        'success': True,
-        'item_count': len(content),
-        'items': items
-    })
+    return Response(stream_with_context(generate()),
+                    mimetype='application/x-ndjson')
 
 
 @app.route('/api/audio/<int:index>')
 def get_audio(index: int):
     """Generate and stream audio for a specific item."""
     session_id = session.get('session_id')
+    session_data = session_store.get(session_id) if session_id else None
 
-    if not session_id or session_id not in sessions:
+    if session_data is None:
         return jsonify({'error': 'Session not found'}), 404
 
-    session_data = sessions[session_id]
     content = session_data.get('content', [])
 
     if index < 0 or index >= len(content):
         return jsonify({'error': 'Invalid index'}), 404
 
     author, text = content[index]
-    voice_manager = EdgeTTSVoiceManager.from_dict(session_data['voice_manager'])
-    voice_id, voice_name = voice_manager.get_voice_for_agent(author)
 
-    # Generate audio with author introduction
+    assignments = session_data.get('assignments', [])
+    if index < len(assignments):
+        voice_id, voice_name = assignments[index]
+    else:
+        # Session predates per-index assignments; rebuild the manager
+        voice_manager = EdgeTTSVoiceManager.from_dict(session_data['voice_manager'])
+        voice_id, voice_name = voice_manager.get_voice_for_agent(author)
+
+    headers = {
+        'Content-Disposition': f'inline; filename="audio_{index}.mp3"',
+        'X-Author': author,
+        'X-Voice': voice_name
+    }
+
     text_with_intro = f"{author} says, {text}"
+    range_header = request.headers.get('Range')
+
+    # Serve prefetched audio if /api/load already generated it
+    audio_data = session_store.get_audio(session_id, index)
+
+    if audio_data is None and range_header:
+        # Seeking needs the complete payload; synthesize it (cache-aware)
+        # rather than streaming so the slice below has something to cut
+        audio_data = run_async(generate_audio(text_with_intro, voice_id))
+        session_store.set_audio(session_id, index, audio_data)
+
+    if audio_data is not None:
+        # Browsers seek within <audio> by re-requesting byte ranges;
+        # serving them from the cached bytes avoids re-synthesis
+        headers['Accept-Ranges'] = 'bytes'
 
-    # Run async audio generation
-    audio_data = asyncio.run(generate_audio(text_with_intro, voice_id))
+        match = _RANGE_RE.match(range_header) if range_header else None
+        if match:
+            total = len(audio_data)
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else total - 1
+            end = min(end, total - 1)
+
+            if start >= total:
+                return Response(status=416, headers={
+                    'Content-Range': f'bytes */{total}'
+                })
+
+            headers['Content-Range'] = f'bytes {start}-{end}/{total}'
+            return Response(audio_data[start:end + 1], status=206,
+                            mimetype='audio/mpeg', headers=headers)
+
+        return Response(audio_data, mimetype='audio/mpeg', headers=headers)
+
+    # Cache miss: stream chunks to the client as they are synthesized,
+    # caching the assembled bytes for subsequent requests
+    def cache_audio(audio: bytes):
+        session_store.set_audio(session_id, index, audio)
 
     return Response(
-        audio_data,
+        stream_audio(text_with_intro, voice_id, on_complete=cache_audio),
         mimetype='audio/mpeg',
-        headers={
-            'Content-Disposition': f'inline; filename="audio_{index}.mp3"',
-            'X-Author': author,
-            'X-Voice': voice_name
-        }
+        headers=headers,
+        direct_passthrough=True
     )
 
 
@@ -386,12 +1101,14 @@ def reset_session():
     """Reset the current session."""
     session_id = session.get('session_id')
 
-    if session_id and session_id in sessions:
-        del sessions[session_id]
+    if session_id:
+        session_store.delete(session_id)
 
     session['session_id'] = str(uuid.uuid4())
     return jsonify({'success': True})
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # Local development only; production runs under gunicorn (see
+    # Dockerfile). threaded=True lets concurrent audio requests coexist.
+    app.run(host='0.0.0.0', port=5001, threaded=True)
@@ -7,6 +7,7 @@ class MoltReaderApp {
         // DOM Elements
         this.urlInput = document.getElementById('url-input');
         this.loadBtn = document.getElementById('load-btn');
+        this.forceReload = document.getElementById('force-reload');
         this.playBtn = document.getElementById('play-btn');
         this.pauseBtn = document.getElementById('pause-btn');
         this.skipBtn = document.getElementById('skip-btn');
@@ -82,28 +83,64 @@ class MoltReaderApp {
             const response = await fetch('/api/load', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ url })
+                body: JSON.stringify({ url, force: this.forceReload.checked })
             });
 
-            const data = await response.json();
-
             if (!response.ok) {
+                const data = await response.json();
                 throw new Error(data.error || 'Failed to load page');
             }
 
-            this.items = data.items;
+            // The server streams NDJSON: an item_count line, one line per
+            // item, then a completion line. Items appear as they arrive.
+            this.items = [];
             this.currentIndex = 0;
+            let itemCount = 0;
 
-            this.setStatus(`Loaded ${data.item_count} items. Click Play to start.`);
-            this.updateProgress();
-            this.enableControls(true);
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+
+            const handleLine = (line) => {
+                if (!line.trim()) return;
+                const msg = JSON.parse(line);
 
-            // Show preview of first item
-            if (this.items.length > 0) {
-                const first = this.items[0];
-                this.setCurrentText(`[First item by ${first.author}]\n\n${first.text}`);
+                if (msg.error) {
+                    throw new Error(msg.error);
+                }
+
+                if (msg.index !== undefined) {
+                    this.items.push(msg);
+                    this.setStatus(`Loading items... ${this.items.length} / ${itemCount}`);
+
+                    // Show preview of first item as soon as it arrives
+                    if (this.items.length === 1) {
+                        this.setCurrentText(`[First item by ${msg.author}]\n\n${msg.text}`);
+                    }
+                } else if (msg.item_count !== undefined) {
+                    itemCount = msg.item_count;
+                }
+            };
+
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                lines.forEach(handleLine);
+            }
+            handleLine(buffer);
+
+            if (this.items.length === 0) {
+                throw new Error('No posts or comments found on this page');
             }
 
+            this.setStatus(`Loaded ${this.items.length} items. Click Play to start.`);
+            this.updateProgress();
+            this.enableControls(true);
+
         } catch (error) {
             this.setStatus(`Error: ${error.message}`);
         } finally {